@@ -7,6 +7,9 @@ algebra concepts with interactive tools, progress tracking, and AI features.
 Version: 2.0.0
 Author: Algebra Visualizer Team
 License: MIT
+
+Set ALGVIZ_BANNER=1 to print the startup banner on import; otherwise it is
+only emitted through the package logger.
 """
 
 __version__ = "2.0.0"
@@ -14,35 +17,139 @@ __author__ = "Algebra Visualizer Team"
 __email__ = "contact@algebra-visualizer.com"
 __license__ = "MIT"
 
-# Package imports for easy access
-from .config import config
-from .auth import AuthSystem, auth_system, render_login_register_forms, require_auth
-from .database import DatabaseManager, db_manager
-from .math_engine import MathEngine, math_engine
-from .visualizations import Visualizations, viz
-from .gamification import GamificationEngine, game_engine
-from .voice_commands import VoiceCommandSystem, voice_system
-from .export_utils import ExportManager, export_manager
-from .themes import THEMES, get_theme_css
+import functools
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Package attributes are resolved lazily on first access (PEP 562) so that
+# importing the package does not pull in streamlit, sympy, plotly, etc.
+_LAZY = {
+    'config': ('.config', 'config'),
+    'AuthSystem': ('.auth', 'AuthSystem'),
+    'auth_system': ('.auth', 'auth_system'),
+    'render_login_register_forms': ('.auth', 'render_login_register_forms'),
+    'require_auth': ('.auth', 'require_auth'),
+    'DatabaseManager': ('.analytics', 'DatabaseManager'),
+    'db_manager': ('.analytics', 'db_manager'),
+    'MathEngine': ('.math_engine', 'MathEngine'),
+    'math_engine': ('.math_engine', 'math_engine'),
+    'Visualizations': ('.visualizations', 'Visualizations'),
+    'viz': ('.visualizations', 'viz'),
+    'GamificationEngine': ('.gamification', 'GamificationEngine'),
+    'game_engine': ('.gamification', 'game_engine'),
+    'VoiceCommandSystem': ('.voice_commands', 'VoiceCommandSystem'),
+    'ExportManager': ('.export_utils', 'ExportManager'),
+    'export_manager': ('.export_utils', 'export_manager'),
+    'THEMES': ('.theme', 'THEMES'),
+    'get_theme_css': ('.theme', 'get_theme_css'),
+    # Main application class
+    'AlgebraVisualizerApp': ('.app', 'AlgebraVisualizerApp'),
+}
+
+_ALL_LAZY = tuple(_LAZY)
+
+def __getattr__(name):
+    """Import package attributes on first access"""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, attr)
+    globals()[name] = value
+    return value
 
-# Main application class
-from .app import AlgebraVisualizerApp
+# Static platform information, built once at import
+_PLATFORM_INFO = MappingProxyType({
+    "version": __version__,
+    "features": (
+        "Interactive Algebra Learning",
+        "Real-time Visualizations",
+        "Progress Tracking & Gamification",
+        "Voice Command System",
+        "Export & Reporting",
+        "Multi-theme Support",
+        "User Authentication",
+        "AI-powered Explanations",
+    ),
+    "supported_formats": ("PDF", "PNG", "CSV", "JSON", "HTML"),
+    "math_areas": (
+        "Algebra Basics",
+        "Quadratic Equations",
+        "Polynomials",
+        "Calculus",
+        "Geometry",
+        "Word Problems",
+    ),
+})
+
+# Heavy third-party modules pre-imported in the background at startup
+_WARMUP_MODULES = ('sympy', 'matplotlib', 'plotly', 'reportlab', 'PIL')
+_WARMUP_TIMEOUT = 2.0
+
+def _warm_imports():
+    """Import heavy dependencies so later first use does not block"""
+    for module_name in _WARMUP_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+        except Exception:
+            logger.exception("Failed to pre-import %s", module_name)
+
+def _start_warmup(session_state):
+    """Start the warm-up thread once per session and return it"""
+    if '_warmup_thread' not in session_state:
+        warmup_thread = threading.Thread(target=_warm_imports, daemon=True)
+        warmup_thread.start()
+        session_state._warmup_thread = warmup_thread
+    return session_state._warmup_thread
+
+# Package submodules imported in parallel when the app starts
+_PRELOAD_SUBMODULES = ('.config', '.auth', '.analytics', '.math_engine', '.visualizations', '.theme')
+# Submodules whose preload has been attempted, whether or not it succeeded
+_preload_attempted = set()
+
+def _preload_submodule(module_name):
+    """Import a package submodule, leaving failures to the real import site"""
+    try:
+        importlib.import_module(module_name, __name__)
+    except ImportError:
+        return
+    # Importing binds the submodule over a lazily exported name such as
+    # ``config``; unbind it so the next access resolves through _LAZY again
+    attr = module_name.lstrip('.')
+    if attr in _LAZY:
+        globals().pop(attr, None)
 
 # Utility functions
 def initialize_platform():
     """Initialize the complete algebra platform"""
     import streamlit as st
     from .auth import initialize_auth
-    from .database import DatabaseManager
-    
-    # Initialize authentication
-    initialize_auth()
     
-    # Initialize database
-    db_manager = DatabaseManager()
+    # Warm up heavy imports while Streamlit bootstraps the UI
+    _start_warmup(st.session_state)
     
-    # Initialize session state
-    if 'platform_initialized' not in st.session_state:
+    # One-time setup per browser session; reruns skip straight past it
+    if not st.session_state.get('platform_initialized'):
+        # Initialize authentication
+        initialize_auth()
+        
+        # Initialize database (reuses the shared manager from analytics)
+        from .analytics import db_manager
+        st.session_state.db = db_manager
+        
+        # Initialize session state
         st.session_state.platform_initialized = True
         st.session_state.current_section = "Dashboard"
         st.session_state.learning_mode = "Intermediate"
@@ -52,60 +159,38 @@ def initialize_platform():
 
 def get_platform_info():
     """Get platform information and statistics"""
-    return {
-        "version": __version__,
-        "features": [
-            "Interactive Algebra Learning",
-            "Real-time Visualizations", 
-            "Progress Tracking & Gamification",
-            "Voice Command System",
-            "Export & Reporting",
-            "Multi-theme Support",
-            "User Authentication",
-            "AI-powered Explanations"
-        ],
-        "supported_formats": ["PDF", "PNG", "CSV", "JSON", "HTML"],
-        "math_areas": [
-            "Algebra Basics",
-            "Quadratic Equations", 
-            "Polynomials",
-            "Calculus",
-            "Geometry",
-            "Word Problems"
-        ]
-    }
+    return _PLATFORM_INFO
+
+# Availability record for a single required package
+DepStatus = namedtuple('DepStatus', 'name description ok')
 
+# Required third-party packages and what they are used for
+_REQUIRED_PACKAGES = tuple((sys.intern(name), sys.intern(description)) for name, description in (
+    ('streamlit', 'Web application framework'),
+    ('numpy', 'Numerical computations'),
+    ('pandas', 'Data manipulation'),
+    ('plotly', 'Interactive visualizations'),
+    ('sympy', 'Symbolic mathematics'),
+    ('matplotlib', 'Static plotting'),
+    ('PIL', 'Image processing'),
+    ('reportlab', 'PDF generation'),
+))
+
+@functools.lru_cache(maxsize=1)
 def check_dependencies():
-    """Check if all required dependencies are available"""
-    import importlib
-    import sys
-    
-    required_packages = {
-        'streamlit': 'Web application framework',
-        'numpy': 'Numerical computations',
-        'pandas': 'Data manipulation',
-        'plotly': 'Interactive visualizations',
-        'sympy': 'Symbolic mathematics',
-        'matplotlib': 'Static plotting',
-        'PIL': 'Image processing',
-        'reportlab': 'PDF generation'
-    }
-    
-    missing = []
-    available = []
-    
-    for package, description in required_packages.items():
-        try:
-            importlib.import_module(package)
-            available.append((package, description, "✅"))
-        except ImportError:
-            missing.append((package, description, "❌"))
+    """Check if all required dependencies are available (cached, read-only)"""
+    # find_spec only locates the package; it never executes it
+    statuses = tuple(
+        DepStatus(package, description, importlib.util.find_spec(package) is not None)
+        for package, description in _REQUIRED_PACKAGES
+    )
+    missing = tuple(status for status in statuses if not status.ok)
     
-    return {
-        "available": available,
+    return MappingProxyType({
+        "available": tuple(status for status in statuses if status.ok),
         "missing": missing,
         "all_available": len(missing) == 0
-    }
+    })
 
 # Error classes
 class AlgebraVisualizerError(Exception):
@@ -129,60 +214,55 @@ class AuthError(AlgebraVisualizerError):
     pass
 
 # Constants
-SUPPORTED_BROWSERS = ["Chrome", "Firefox", "Safari", "Edge"]
-SUPPORTED_DEVICES = ["Desktop", "Tablet", "Mobile"]
+SUPPORTED_BROWSERS = ("Chrome", "Firefox", "Safari", "Edge")
+SUPPORTED_DEVICES = ("Desktop", "Tablet", "Mobile")
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
 # Platform configuration defaults
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG = MappingProxyType({
     "theme": "Professional Dark",
     "auto_save": True,
     "notifications": True,
     "voice_commands": True,
     "difficulty": "Intermediate",
     "language": "English"
-}
+})
 
 # Export the main application runner
 def run_app():
     """Run the main Algebra Visualizer application"""
+    import streamlit as st
     from .app import AlgebraVisualizerApp
-    app = AlgebraVisualizerApp()
-    app.run()
-
-# Make essential classes available at package level
-__all__ = [
-    # Core classes
-    'AlgebraVisualizerApp',
-    'MathEngine', 
-    'Visualizations',
-    'DatabaseManager',
-    'AuthSystem',
-    'GamificationEngine',
-    'VoiceCommandSystem',
-    'ExportManager',
     
-    # Instances
-    'math_engine',
-    'viz', 
-    'db_manager',
-    'auth_system',
-    'game_engine',
-    'voice_system',
-    'export_manager',
+    # Warm up heavy imports in the background while the submodules load
+    warmup_thread = _start_warmup(st.session_state)
     
-    # Functions
+    # Load the app's submodules in parallel before the first page renders;
+    # each is attempted once per process, so reruns never start a pool
+    pending = [name for name in _PRELOAD_SUBMODULES if name not in _preload_attempted]
+    if pending:
+        _preload_attempted.update(pending)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_preload_submodule, pending))
+    
+    # Give the warm-up a moment to finish before the first render
+    warmup_thread.join(timeout=_WARMUP_TIMEOUT)
+    
+    AlgebraVisualizerApp().run()
+
+# Keep the star-import surface small so it never touches heavy submodules;
+# everything in _ALL_LAZY is still reachable as a package attribute
+__all__ = (
+    'run_app',
     'initialize_platform',
     'get_platform_info',
     'check_dependencies',
-    'run_app',
-    'render_login_register_forms',
-    'require_auth',
-    
-    # Constants
-    'THEMES',
-    'get_theme_css',
-    'config'
-]
+    'config',
+)
+
+def __dir__():
+    return sorted(set(globals()) | set(_ALL_LAZY))
 
-print(f"Algebra Visualizer Pro {__version__} initialized successfully!")
\ No newline at end of file
+logger.info("Algebra Visualizer Pro %s initialized", __version__)
+if os.environ.get("ALGVIZ_BANNER") == "1":
+    print(f"Algebra Visualizer Pro {__version__} initialized successfully!")
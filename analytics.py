@@ -7,6 +7,7 @@ from typing import Dict, List, Any, Optional
 import logging
 import hashlib
 import time
+import threading
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -826,8 +827,22 @@ class DatabaseManager:
             logger.error(f"Error optimizing database: {e}")
             return False
 
-# Singleton instance
-db_manager = DatabaseManager()
+# Singleton instance (created on first use)
+_db_manager = None
+_db_manager_lock = threading.Lock()
+
+def _get_db_manager():
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+    return _db_manager
+
+def __getattr__(name):
+    if name == 'db_manager':
+        return _get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Streamlit UI components for database management
 def render_database_admin_panel():
@@ -856,7 +871,7 @@ def render_system_analytics():
     """Render system analytics dashboard"""
     st.subheader("System Analytics")
     
-    analytics = db_manager.get_system_analytics()
+    analytics = _get_db_manager().get_system_analytics()
     
     if analytics:
         user_stats = analytics.get('user_statistics', {})
@@ -908,7 +923,7 @@ def render_content_management():
         
         if st.form_submit_button("Add Formula"):
             if formula_name and formula_latex:
-                success = db_manager.add_formula({
+                success = _get_db_manager().add_formula({
                     'formula_name': formula_name,
                     'formula_latex': formula_latex,
                     'category': category,
@@ -928,7 +943,7 @@ def render_maintenance_tools():
     with col1:
         if st.button("🔄 Optimize Database", use_container_width=True):
             with st.spinner("Optimizing database..."):
-                success = db_manager.optimize_database()
+                success = _get_db_manager().optimize_database()
                 if success:
                     st.success("Database optimized successfully!")
                 else:
@@ -937,7 +952,7 @@ def render_maintenance_tools():
     with col2:
         if st.button("💾 Create Backup", use_container_width=True):
             backup_path = f"backup_{int(time.time())}.db"
-            success = db_manager.backup_database(backup_path)
+            success = _get_db_manager().backup_database(backup_path)
             if success:
                 st.success(f"Backup created: {backup_path}")
             else:
@@ -946,7 +961,7 @@ def render_maintenance_tools():
     # Database info
     st.subheader("Database Information")
     try:
-        conn = db_manager._get_connection()
+        conn = _get_db_manager()._get_connection()
         c = conn.cursor()
         
         # Get table sizes
@@ -6,6 +6,7 @@ import time
 from datetime import datetime, timedelta
 import re
 import json
+import threading
 
 class AuthSystem:
     def __init__(self, db_path="data/user_progress.db"):
@@ -263,5 +264,19 @@ def initialize_auth():
     if 'is_authenticated' not in st.session_state:
         st.session_state.is_authenticated = False
 
-# Global auth instance
-auth_system = AuthSystem()
\ No newline at end of file
+# Global auth instance (created on first use)
+_auth_system = None
+_auth_system_lock = threading.Lock()
+
+def _get_auth_system():
+    global _auth_system
+    if _auth_system is None:
+        with _auth_system_lock:
+            if _auth_system is None:
+                _auth_system = AuthSystem()
+    return _auth_system
+
+def __getattr__(name):
+    if name == 'auth_system':
+        return _get_auth_system()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -19,6 +19,7 @@ import tempfile
 import os
 from PIL import Image as PILImage
 import plotly.io as pio
+import threading
 
 class ExportManager:
     def __init__(self):
@@ -997,8 +998,22 @@ def render_quick_export_buttons():
                 mime="application/pdf"
             )
 
-# Global export manager instance
-export_manager = ExportManager()
+# Global export manager instance (created on first use)
+_export_manager = None
+_export_manager_lock = threading.Lock()
+
+def _get_export_manager():
+    global _export_manager
+    if _export_manager is None:
+        with _export_manager_lock:
+            if _export_manager is None:
+                _export_manager = ExportManager()
+    return _export_manager
+
+def __getattr__(name):
+    if name == 'export_manager':
+        return _get_export_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Example usage in main app
 """
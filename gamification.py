@@ -2,6 +2,7 @@ import sqlite3
 import time
 import json
 from datetime import datetime, timedelta
+import threading
 
 class GamificationEngine:
     def __init__(self, db_path="data/user_progress.db"):
@@ -215,5 +216,19 @@ class GamificationEngine:
             "achievements": [ach[0] for ach in user_achievements]
         }
 
-# Global instance
-game_engine = GamificationEngine()
\ No newline at end of file
+# Global instance (created on first use)
+_game_engine = None
+_game_engine_lock = threading.Lock()
+
+def _get_game_engine():
+    global _game_engine
+    if _game_engine is None:
+        with _game_engine_lock:
+            if _game_engine is None:
+                _game_engine = GamificationEngine()
+    return _game_engine
+
+def __getattr__(name):
+    if name == 'game_engine':
+        return _get_game_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,6 +5,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 from functools import lru_cache
 import streamlit as st
+import threading
 
 class MathEngine:
     def __init__(self):
@@ -118,5 +119,19 @@ class MathEngine:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-# Global instance
-math_engine = MathEngine()
\ No newline at end of file
+# Global instance (created on first use)
+_math_engine = None
+_math_engine_lock = threading.Lock()
+
+def _get_math_engine():
+    global _math_engine
+    if _math_engine is None:
+        with _math_engine_lock:
+            if _math_engine is None:
+                _math_engine = MathEngine()
+    return _math_engine
+
+def __getattr__(name):
+    if name == 'math_engine':
+        return _get_math_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 THEMES = {
     "Professional Dark": {
         "primary": "#4FD1C7",
@@ -45,7 +47,9 @@ THEMES = {
     }
 }
 
+@lru_cache(maxsize=None)
 def get_theme_css(theme_name):
+    # Cached per theme name; call get_theme_css.cache_clear() if THEMES changes
     theme = THEMES.get(theme_name, THEMES["Professional Dark"])
     
     return f"""
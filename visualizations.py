@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 import streamlit as st
 from math_engine import math_engine
+import threading
 
 class Visualizations:
     def __init__(self):
@@ -162,5 +163,19 @@ class Visualizations:
         
         return fig
 
-# Global instance
-viz = Visualizations()
\ No newline at end of file
+# Global instance (created on first use)
+_viz = None
+_viz_lock = threading.Lock()
+
+def _get_viz():
+    global _viz
+    if _viz is None:
+        with _viz_lock:
+            if _viz is None:
+                _viz = Visualizations()
+    return _viz
+
+def __getattr__(name):
+    if name == 'viz':
+        return _get_viz()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file